@@ -5,21 +5,54 @@
 import sys
 import json
 import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
 import urllib.request
 import urllib.parse
-from datetime import datetime
+from collections import Counter, OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTableWidget, QTableWidgetItem,
+    QPushButton, QLabel, QLineEdit, QTableView,
     QTabWidget, QFileDialog, QMessageBox, QComboBox, QTextEdit,
     QHeaderView, QGroupBox, QProgressDialog, QAbstractItemView, QScrollArea
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QUrl
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import (
+    Qt, QThread, QTimer, pyqtSignal, QUrl,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PyQt5.QtGui import QFont, QBrush
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 
+try:
+    import orjson  # 可选依赖，比标准库json快数倍
+except ImportError:
+    orjson = None
+
+try:
+    import requests  # 可选依赖，复用HTTP连接（keep-alive）
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
 DATA_FILE = "words_data.json"
+DATA_CACHE_FILE = DATA_FILE + ".pkl"  # 加快启动的pickle缓存，JSON更新后自动失效
+WORDS_LOG_FILE = "words.log"  # 复习记录追加日志，定期合并进DATA_FILE
 BACKUP_FLAG_FILE = "last_backup.txt"
+BACKUP_BATCH_SIZE = 1000  # MySQL备份每批插入的行数
+FETCH_WORKERS = 12  # 自动查词的并发线程数
+SAVE_DELAY_MS = 500  # 修改后延迟写盘，合并连续的多次保存
+LOG_COMPACT_INTERVAL_MS = 5 * 60 * 1000  # 复习日志合并间隔
+FETCH_CACHE_FILE = "fetch_cache.db"  # 查词结果缓存
+FETCH_CACHE_MEMORY_SIZE = 4096  # 内存中缓存的查词结果数量
+AUDIO_CACHE_DIR = "audio_cache"  # 单词发音缓存目录
+AUDIO_PREFETCH_AHEAD = 3  # 复习时提前下载后面几个单词的发音
 
 # MySQL配置（根据你的实际情况修改）
 MYSQL_CONFIG = {
@@ -31,6 +64,165 @@ MYSQL_CONFIG = {
 }
 
 
+# 按钮样式，整个窗口只设置一次；按钮通过class/variant属性选择样式
+BUTTON_STYLE_SHEET = """
+QPushButton[class="primary"] { background: #007bff; color: white; border: none; border-radius: 5px; }
+QPushButton[class="success"] { background: #28a745; color: white; border: none; border-radius: 5px; }
+QPushButton[class="secondary"] { background: #6c757d; color: white; border: none; border-radius: 5px; }
+QPushButton[class="info"] { background: #17a2b8; color: white; border: none; border-radius: 5px; }
+QPushButton[class="danger"] { background: #dc3545; color: white; border: none; border-radius: 5px; }
+QPushButton[variant="small"] { border-radius: 4px; }
+QPushButton[variant="toolbar"] { border-radius: 4px; padding: 5px 15px; }
+"""
+
+# 导入单词时使用的正则
+_SPLIT_RE = re.compile(r'[,;，；\t、/|]+')
+_PHRASE_RE = re.compile(r'^[A-Za-z]+(?:\s+[A-Za-z]+)+$')
+_WORD_RE = re.compile(r"[A-Za-z]+(?:[-'][A-Za-z]+)*")
+# Vocabulary.com的例句模式（直接匹配字节，不必解码整个页面）
+_VOCAB_EXAMPLE_RE = re.compile(rb'<h3 class="example">([^<]+)</h3>')
+# 编辑例句时去掉开头的序号（如 "1. "）
+_EXAMPLE_PREFIX_RE = re.compile(r'^\d+\.\s*')
+
+
+def encode_json(obj, indent=False):
+    """序列化为UTF-8字节，优先使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def decode_json(data):
+    """解析JSON字节或字符串，优先使用orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_date(date_str):
+    """解析 YYYY-MM-DD 日期，标准格式直接切片，比strptime快得多"""
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+if requests is not None:
+    # 查词线程共用一个会话，同一域名的请求复用TCP/TLS连接
+    _http_session = requests.Session()
+    _http_session.headers.update(HTTP_HEADERS)
+    _http_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+
+def http_get(url, timeout, headers=None):
+    """GET请求并返回响应内容（字节），失败时抛出异常"""
+    if requests is not None:
+        resp = _http_session.get(url, timeout=timeout, headers=headers)
+        resp.raise_for_status()
+        return resp.content
+    req = urllib.request.Request(url, headers={**HTTP_HEADERS, **(headers or {})})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.read()
+
+
+def http_stream(url, timeout, headers=None, chunk_size=65536):
+    """GET请求并分块返回响应内容，提前停止迭代时关闭连接"""
+    if requests is not None:
+        with _http_session.get(url, timeout=timeout, headers=headers, stream=True) as resp:
+            resp.raise_for_status()
+            yield from resp.iter_content(chunk_size)
+        return
+    req = urllib.request.Request(url, headers={**HTTP_HEADERS, **(headers or {})})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        while True:
+            chunk = resp.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def pronunciation_url(word):
+    """有道词典语音API地址（type=1: 美式发音, type=2: 英式发音）"""
+    return f"https://dict.youdao.com/dictvoice?audio={urllib.parse.quote(word)}&type=1"
+
+
+def audio_cache_path(word):
+    """单词发音的本地缓存文件路径"""
+    return os.path.join(AUDIO_CACHE_DIR, urllib.parse.quote(word, safe='') + ".mp3")
+
+
+@lru_cache(maxsize=1024)
+def _meaning_match_keys(meaning):
+    """判题用的释义预处理结果：(去空格小写的释义, 第一个关键词, 释义中所有相邻两字)"""
+    meaning_norm = meaning.lower().replace(" ", "")
+    keywords = meaning.split('；')[0].split('，')[0].split('、')[0].split(';')[0]
+    keywords = keywords.replace(" ", "").lower()
+    bigrams = frozenset(meaning_norm[i:i+2] for i in range(len(meaning_norm) - 1))
+    return meaning_norm, keywords, bigrams
+
+
+@lru_cache(maxsize=4096)
+def _fuzzy_match(user_input, correct):
+    """判断答案是否与释义相近（user_input已去空格转小写）；按释义文本缓存，修改释义后自然失效"""
+    correct_lower, keywords, bigrams = _meaning_match_keys(correct)
+    
+    if user_input in correct_lower or correct_lower in user_input:
+        return True
+    
+    if user_input in keywords or keywords in user_input:
+        return True
+    
+    # 释义中任意相邻两字出现在答案里即算对
+    if len(user_input) >= 2:
+        if not bigrams.isdisjoint(user_input[i:i+2] for i in range(len(user_input) - 1)):
+            return True
+    
+    return False
+
+
+@lru_cache(maxsize=None)
+def ui_font(size, bold=False):
+    """界面字体，同一字号只创建一次（须在QApplication创建之后调用）"""
+    if bold:
+        return QFont("Microsoft YaHei", size, QFont.Bold)
+    return QFont("Microsoft YaHei", size)
+
+
+def _iter_vocabulary_examples(chunks, limit):
+    """从分块读取的Vocabulary.com页面中提取例句，找到limit个后停止读取"""
+    buf = b""
+    found = 0
+    try:
+        for chunk in chunks:
+            buf += chunk
+            last_end = 0
+            for match in _VOCAB_EXAMPLE_RE.finditer(buf):
+                yield match.group(1).decode('utf-8', 'replace')
+                found += 1
+                if found >= limit:
+                    return
+                last_end = match.end()
+            # 只保留可能被分块截断的最后一个标签，其余已扫描内容直接丢弃
+            tail = buf.rfind(b'<h3', last_end)
+            buf = buf[tail if tail != -1 else max(last_end, len(buf) - 2):]
+    finally:
+        chunks.close()
+
+
+# 备份写入语句。pymysql的executemany只有在语句形如 INSERT ... VALUES (%s, ...) [ON DUPLICATE ...]
+# 时才会把一批参数合并成一条多行INSERT发送，修改时要保持这个结构
+BACKUP_INSERT_SQL = (
+    "INSERT INTO words_backup "
+    "(backup_date, word, meaning, examples, review_count, last_review, last_review_date, today_reviewed) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE "
+    "meaning = VALUES(meaning), examples = VALUES(examples), "
+    "review_count = VALUES(review_count), last_review = VALUES(last_review), "
+    "last_review_date = VALUES(last_review_date), today_reviewed = VALUES(today_reviewed)"
+)
+
+
 def backup_to_mysql(words_data):
     """备份数据到MySQL"""
     try:
@@ -52,7 +244,7 @@ def backup_to_mysql(words_data):
             print(f"[备份] 创建数据库时出错: {e}")
         
         # 连接到指定数据库
-        conn = pymysql.connect(**MYSQL_CONFIG)
+        conn = pymysql.connect(**MYSQL_CONFIG, autocommit=False)
         cursor = conn.cursor()
         
         # 创建表（如果不存在）
@@ -60,7 +252,7 @@ def backup_to_mysql(words_data):
             CREATE TABLE IF NOT EXISTS words_backup (
                 id INT AUTO_INCREMENT PRIMARY KEY,
                 backup_date DATE NOT NULL,
-                word VARCHAR(200) NOT NULL,
+                word VARCHAR(200) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL,
                 meaning TEXT,
                 examples JSON,
                 review_count INT DEFAULT 0,
@@ -69,36 +261,59 @@ def backup_to_mysql(words_data):
                 today_reviewed BOOLEAN DEFAULT FALSE,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 INDEX idx_backup_date (backup_date),
-                INDEX idx_word (word)
+                INDEX idx_word (word),
+                UNIQUE KEY uq_day_word (backup_date, word)
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """)
         
+        # 旧版本建的表没有唯一索引，补上后才能按(日期, 单词)覆盖写入
+        cursor.execute("SHOW INDEX FROM words_backup WHERE Key_name = 'uq_day_word'")
+        if not cursor.fetchone():
+            cursor.execute("""
+                ALTER TABLE words_backup
+                MODIFY word VARCHAR(200) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL,
+                ADD UNIQUE KEY uq_day_word (backup_date, word)
+            """)
+        
         # 获取今天日期
         today = datetime.now().strftime("%Y-%m-%d")
         
-        # 删除今天的旧备份（如果有）
-        cursor.execute("DELETE FROM words_backup WHERE backup_date = %s", (today,))
-        
-        # 插入新备份
-        for word, data in words_data.items():
-            cursor.execute("""
-                INSERT INTO words_backup 
-                (backup_date, word, meaning, examples, review_count, last_review, last_review_date, today_reviewed)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                today,
-                word,
-                data.get("meaning", ""),
-                json.dumps(data.get("examples", []), ensure_ascii=False),
-                data.get("review_count", 0),
-                data.get("last_review", ""),
-                data.get("last_review_date", ""),
-                data.get("today_reviewed", False)
-            ))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        # 例句先单独批量序列化：orjson直接调用，标准库则复用同一个编码器
+        if orjson is not None:
+            dumps = orjson.dumps
+            examples_enc = [dumps(data.get("examples", [])).decode('utf-8') for data in words_data.values()]
+        else:
+            dumps = json.JSONEncoder(ensure_ascii=False).encode
+            examples_enc = [dumps(data.get("examples", [])) for data in words_data.values()]
+        
+        rows = [(
+            today,
+            word,
+            data.get("meaning", ""),
+            examples,
+            data.get("review_count", 0),
+            data.get("last_review", ""),
+            data.get("last_review_date", ""),
+            data.get("today_reviewed", False)
+        ) for (word, data), examples in zip(words_data.items(), examples_enc)]
+        
+        # 整个备份放在同一个事务中，批量导入期间关闭外键检查
+        # （唯一性检查不能关，覆盖写入依赖uq_day_word判重）
+        cursor.execute("SET foreign_key_checks = 0")
+        conn.begin()
+        try:
+            # 今天已备份过的单词直接覆盖，不再先删除再插入
+            for start in range(0, len(rows), BACKUP_BATCH_SIZE):
+                cursor.executemany(BACKUP_INSERT_SQL, rows[start:start + BACKUP_BATCH_SIZE])
+            
+            conn.commit()
+            cursor.execute("SET foreign_key_checks = 1")
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
         
         # 记录备份时间
         with open(BACKUP_FLAG_FILE, 'w') as f:
@@ -141,31 +356,162 @@ class FetchWorker(QThread):
     def run(self):
         count = 0
         total = len(self.words)
-        for i, word in enumerate(self.words):
-            if self.cancelled:
-                break
-            self.progress.emit(i + 1, total, word)
-            success, meaning = self.manager.add_word_auto(word)
+        # 查词是纯网络等待，多线程并发查询
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = {executor.submit(self.manager.add_word_auto, word): word for word in self.words}
+            for done, future in enumerate(as_completed(futures), 1):
+                if self.cancelled:
+                    for f in futures:
+                        f.cancel()
+                    break
+                self.progress.emit(done, total, futures[future])
+        
+        # 取消时正在查询的单词仍会写入，一并统计
+        for future, word in futures.items():
+            if future.cancelled():
+                continue
+            success, meaning = future.result()
             if success:
                 count += 1
                 self.added_words.append((word, meaning))
+        # 整批查完后统一写盘一次；交给后台写盘线程，失败时会报告并在下次保存时重试
+        self.manager.save_data_async()
         self.finished.emit(count, self.added_words)
 
 
+class AudioFetchWorker(QThread):
+    """后台下载单词发音到本地缓存的线程"""
+    def __init__(self, word):
+        super().__init__()
+        self.word = word
+    
+    def run(self):
+        path = audio_cache_path(self.word)
+        try:
+            data = http_get(pronunciation_url(self.word), timeout=8)
+            os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+            tmp_file = path + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, path)
+        except Exception:
+            pass  # 下载失败时仍可在线播放
+
+
+class BackupWorker(QThread):
+    """后台执行MySQL备份的线程"""
+    finished = pyqtSignal(bool, str)  # 返回是否成功和提示信息
+    
+    def __init__(self, words_data):
+        super().__init__()
+        self.words_data = words_data
+    
+    def run(self):
+        success, message = backup_to_mysql(self.words_data)
+        self.finished.emit(success, message)
+
+
+class FetchCache:
+    """查词结果缓存 - 内存LRU + SQLite持久化，以小写单词为键"""
+    def __init__(self, path):
+        self._lock = threading.Lock()  # 多个查词线程共用同一连接
+        self._memory = OrderedDict()
+        try:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "word TEXT PRIMARY KEY, meaning TEXT, examples TEXT, ts INTEGER)"
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"[缓存] 打开查词缓存失败: {e}")
+            self._conn = None
+    
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > FETCH_CACHE_MEMORY_SIZE:
+            self._memory.popitem(last=False)
+    
+    def get(self, word):
+        """返回缓存的 (含义, 例句)，没有则返回None"""
+        key = word.lower()
+        with self._lock:
+            value = self._memory.get(key)
+            if value is None and self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT meaning, examples FROM cache WHERE word = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row is not None:
+                    value = (row[0], decode_json(row[1]))
+            if value is None:
+                return None
+            self._remember(key, value)
+        meaning, examples = value
+        return meaning, [dict(ex) for ex in examples]
+    
+    def put(self, word, meaning, examples):
+        key = word.lower()
+        examples = [dict(ex) for ex in examples]
+        with self._lock:
+            self._remember(key, (meaning, examples))
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (word, meaning, examples, ts) VALUES (?, ?, ?, ?)",
+                    (key, meaning, encode_json(examples).decode('utf-8'), int(time.time()))
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"[缓存] 写入查词缓存失败: {e}")
+
+
 class WordManager:
     """单词数据管理"""
     def __init__(self):
         self.words = {}
         self.today_tasks = []  # 今日任务列表
         self.today_completed = set()  # 今日已完成
+        self._review_queue = deque()  # 今日任务的复习顺序，已完成的单词在取出时跳过
+        self._lock = threading.RLock()  # 查词线程并发写入时加锁
+        self._lower_index = Counter()  # 小写单词 -> 数量，用于不区分大小写的查重
+        self._levels = ({}, {}, {})  # 按复习阶段分组的单词（有序集合）：未复习/复习中/已掌握
+        self.fetch_cache = FetchCache(FETCH_CACHE_FILE)
+        self._dirty = False  # 有未写盘的修改
+        self._write_lock = threading.Lock()  # 同一时间只有一个线程写数据文件
+        self._save_executor = ThreadPoolExecutor(max_workers=1)  # 后台写盘线程，按提交顺序写入
+        self._save_gen = 0  # 最近一次保存快照的序号
+        self._written_gen = 0  # 已写入磁盘的快照序号
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+        self._tasks_inited = False  # 今日任务在第一次用到时才计算
+        self._log = None  # 复习记录日志，加载数据后再打开
         self.load_data()
-        self.init_today_tasks()
+        torn = self._replay_log()
+        self._rebuild_levels()
+        self._log = open(WORDS_LOG_FILE, 'ab', buffering=0)
+        if torn:
+            self.save_data()  # 立即合并，避免新记录接在半行后面
+        self._compact_timer = QTimer()
+        self._compact_timer.timeout.connect(self.compact_log)
+        self._compact_timer.start(LOG_COMPACT_INTERVAL_MS)
     
     def load_data(self):
         if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            cached = self._load_data_cache()
+            if cached is not None:
+                self.words = cached
+                self._lower_index = Counter(w.lower() for w in cached)
+                return
+            with open(DATA_FILE, 'rb') as f:
+                data = decode_json(f.read())
                 # 兼容旧数据，添加last_review_date字段
+                migrated = False
                 for word, info in data.items():
                     if "last_review_date" not in info:
                         # 从last_review提取日期
@@ -174,14 +520,168 @@ class WordManager:
                             info["last_review_date"] = last_review[:10]  # 提取 YYYY-MM-DD
                         else:
                             info["last_review_date"] = ""
+                        migrated = True
                     if "today_reviewed" not in info:
                         info["today_reviewed"] = False
+                        migrated = True
                 self.words = data
-                self.save_data()  # 保存更新后的数据
+                self._lower_index = Counter(w.lower() for w in data)
+                if migrated:
+                    self.save_data()  # 保存更新后的数据
+                else:
+                    self._save_data_cache()  # JSON不用重写，只补上pickle缓存
+    
+    def save_data(self, sync=False):
+        """立即保存到磁盘；sync=True时落盘"""
+        self._write_snapshot(*self._take_snapshot(), sync=sync)
+    
+    def save_data_async(self):
+        """界面线程只做序列化，写文件交给后台线程"""
+        future = self._save_executor.submit(self._write_snapshot, *self._take_snapshot())
+        future.add_done_callback(self._on_async_save_done)
+    
+    def _on_async_save_done(self, future):
+        """后台写盘失败时报告错误，并重新标记为未保存，下次保存时重试"""
+        e = future.exception()
+        if e is not None:
+            print(f"[保存] 写入数据文件失败: {e}")
+            self._dirty = True
+    
+    def _take_snapshot(self):
+        """序列化当前数据，返回 (序号, JSON, pickle缓存, 日志长度)"""
+        with self._lock:
+            self._dirty = False
+            self._save_gen += 1
+            log_size = os.fstat(self._log.fileno()).st_size if self._log is not None else 0
+            return (self._save_gen, encode_json(self.words, indent=True),
+                    pickle.dumps(self.words, protocol=pickle.HIGHEST_PROTOCOL), log_size)
+    
+    def _write_snapshot(self, gen, data, cache_data, log_size, sync=False):
+        """写入临时文件后原子替换，写到一半崩溃也不会损坏原数据"""
+        with self._write_lock:
+            if gen < self._written_gen:
+                return  # 更新的快照已经写入
+            self._write_file(DATA_FILE, data, sync)
+            self._write_data_cache(cache_data)
+            self._written_gen = gen
+            with self._lock:
+                # 日志中的记录都已写入DATA_FILE；快照之后又追加了记录时保留日志，
+                # 记录保存的是完整状态，下次启动重放旧记录不影响结果
+                if self._log is not None and os.fstat(self._log.fileno()).st_size == log_size:
+                    self._log.truncate(0)
     
-    def save_data(self):
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.words, f, ensure_ascii=False, indent=2)
+    @staticmethod
+    def _write_file(path, data, sync=False):
+        tmp_file = path + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    
+    @staticmethod
+    def _data_file_stamp():
+        """JSON文件的 (修改时间, 大小)，用来判断pickle缓存是否对应当前的JSON"""
+        st = os.stat(DATA_FILE)
+        return st.st_mtime_ns, st.st_size
+    
+    def _write_data_cache(self, cache_data):
+        """写入pickle缓存，必须在JSON之后写：文件开头记录刚写入的JSON的stamp，后面是单词数据"""
+        stamp = pickle.dumps(self._data_file_stamp(), protocol=pickle.HIGHEST_PROTOCOL)
+        self._write_file(DATA_CACHE_FILE, stamp + cache_data)
+    
+    def _save_data_cache(self):
+        """只写入pickle缓存（JSON没有变化时）"""
+        with self._write_lock:
+            self._write_data_cache(pickle.dumps(self.words, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def _load_data_cache(self):
+        """缓存记录的stamp与当前JSON完全一致时读取pickle缓存，失效或出错返回None
+        
+        不能只比较修改时间：从备份恢复或同步得到的旧JSON会保留原来的修改时间
+        """
+        try:
+            with open(DATA_CACHE_FILE, 'rb') as f:
+                if pickle.load(f) != self._data_file_stamp():
+                    return None
+                return pickle.load(f)
+        except Exception:
+            return None
+    
+    def flush(self):
+        """把延迟的修改写入磁盘"""
+        if self._dirty:
+            self.save_data_async()
+    
+    def compact_log(self):
+        """把复习日志合并进数据文件，之前写盘失败的修改也在这里重试"""
+        if self._dirty or (self._log is not None and os.fstat(self._log.fileno()).st_size > 0):
+            self.save_data_async()
+    
+    def _append_log(self, word):
+        """复习只追加一行日志，不重写整个数据文件"""
+        info = self.words[word]
+        record = {
+            "word": word,
+            "review_count": info["review_count"],
+            "last_review": info["last_review"],
+            "last_review_date": info["last_review_date"],
+            "today_reviewed": info["today_reviewed"]
+        }
+        with self._lock:
+            self._log.write(encode_json(record) + b"\n")
+    
+    def _replay_log(self):
+        """启动时把上次未合并的复习记录应用到数据上，日志末尾有残缺行时返回True"""
+        if not os.path.exists(WORDS_LOG_FILE):
+            return False
+        torn = False
+        with open(WORDS_LOG_FILE, 'rb') as f:
+            for line in f:
+                try:
+                    record = decode_json(line)
+                except ValueError:
+                    torn = True  # 异常退出时写了一半的行
+                    continue
+                info = self.words.get(record.pop("word", None))
+                if info is not None:
+                    info.update(record)
+        return torn
+    
+    def _mark_dirty(self):
+        """标记数据已修改，稍后统一保存"""
+        self._dirty = True
+        self._flush_timer.start(SAVE_DELAY_MS)
+    
+    def has_word_ignore_case(self, word):
+        """是否已存在该单词（不区分大小写）"""
+        return word.lower() in self._lower_index
+    
+    @staticmethod
+    def _level(review_count):
+        """复习阶段：0=未复习，1=复习中（1-2次），2=已掌握（>=3次）"""
+        if review_count == 0:
+            return 0
+        return 1 if review_count < 3 else 2
+    
+    def _rebuild_levels(self):
+        """按当前数据重建复习阶段分组"""
+        self._levels = ({}, {}, {})
+        for word, data in self.words.items():
+            self._levels[self._level(data["review_count"])][word] = None
+    
+    def _index_word(self, word):
+        self._lower_index[word.lower()] += 1
+        self._levels[self._level(self.words[word]["review_count"])][word] = None
+    
+    def _unindex_word(self, word):
+        key = word.lower()
+        self._lower_index[key] -= 1
+        if self._lower_index[key] <= 0:
+            del self._lower_index[key]
+        for level in self._levels:
+            level.pop(word, None)
     
     def add_word(self, word, meaning, examples=None):
         word = word.strip()
@@ -194,35 +694,44 @@ class WordManager:
                 "last_review_date": "",
                 "today_reviewed": False
             }
-            self.save_data()
+            self._index_word(word)
+            self._mark_dirty()
             return True, meaning
         return False, ""
     
     def review_word(self, word):
         """复习单词 - 复习次数+1，更新时间"""
         if word in self.words:
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+            old_level = self._level(self.words[word]["review_count"])
             self.words[word]["review_count"] += 1
-            self.words[word]["last_review"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            self.words[word]["last_review_date"] = datetime.now().strftime("%Y-%m-%d")
+            new_level = self._level(self.words[word]["review_count"])
+            if new_level != old_level:
+                del self._levels[old_level][word]
+                self._levels[new_level][word] = None
+            self.words[word]["last_review"] = now_str
+            self.words[word]["last_review_date"] = now_str[:10]
             self.words[word]["today_reviewed"] = True
             if word not in self.today_completed:
                 self.today_completed.add(word)
-            self.save_data()
+            self._append_log(word)
     
     def mark_reviewed_without_count(self, word):
         """标记为已复习但不增加复习次数 - 只更新时间"""
         if word in self.words:
-            self.words[word]["last_review"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            self.words[word]["last_review_date"] = datetime.now().strftime("%Y-%m-%d")
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+            self.words[word]["last_review"] = now_str
+            self.words[word]["last_review_date"] = now_str[:10]
             self.words[word]["today_reviewed"] = True
             if word not in self.today_completed:
                 self.today_completed.add(word)
-            self.save_data()
+            self._append_log(word)
     
     def delete_word(self, word):
         if word in self.words:
             del self.words[word]
-            self.save_data()
+            self._unindex_word(word)
+            self._mark_dirty()
             return True
         return False
     
@@ -231,31 +740,63 @@ class WordManager:
         for word in words:
             if word in self.words:
                 del self.words[word]
+                self._unindex_word(word)
                 count += 1
         if count > 0:
-            self.save_data()
+            self._mark_dirty()
         return count
     
+    def clear_words(self):
+        """删除全部单词"""
+        self.words.clear()
+        self._lower_index.clear()
+        for level in self._levels:
+            level.clear()
+        self.save_data_async()
+    
     def get_words_to_review(self):
         """获取今日待复习的单词（从今日任务列表）"""
+        self.ensure_today_tasks()
         return [w for w in self.today_tasks if w not in self.today_completed]
     
+    def peek_next_review_word(self):
+        """下一个待复习的单词，没有则返回None - 均摊O(1)，不用每次重建待复习列表"""
+        self.ensure_today_tasks()
+        queue = self._review_queue
+        while queue and (queue[0] in self.today_completed or queue[0] not in self.words):
+            queue.popleft()
+        return queue[0] if queue else None
+    
+    def upcoming_review_words(self, count):
+        """复习队列中接下来的count个单词（含当前单词）"""
+        pending = (w for w in self._review_queue if w not in self.today_completed and w in self.words)
+        return list(islice(pending, count))
+    
+    def invalidate_today_tasks(self):
+        """单词增删后标记今日任务需要重新计算，下次用到时再算"""
+        self._tasks_inited = False
+    
+    def ensure_today_tasks(self):
+        """今日任务还没有计算过时计算一次"""
+        if not self._tasks_inited:
+            self.init_today_tasks()
+    
     def init_today_tasks(self):
         """初始化今日任务 - 基于艾宾浩斯遗忘曲线"""
+        self._tasks_inited = True
         import random
         from datetime import datetime, timedelta
         
         today = datetime.now().date()
-        today_str = today.strftime("%Y-%m-%d")
+        today_str = today.isoformat()
         day_rng = random.Random(f"daily-review-{today_str}")
         
         self.today_tasks = []
         self.today_completed = set()
         
-        unreviewed = []  # 未复习的
-        reviewing = []   # 复习中的（1-2次）
-        mastered = []    # 已掌握的（>=3次）
-        mastered_due = []  # 已掌握且到期的
+        reviewing = []   # 复习中的（1-2次），元素为 (复习次数, 单词)
+        mastered = []    # 已掌握的（>=3次），元素为 (复习次数, 单词)
+        mastered_due = set()  # 已掌握且到期的
         
         # 艾宾浩斯复习间隔（天数）
         ebbinghaus_intervals = {
@@ -266,54 +807,60 @@ class WordManager:
         }
         default_interval = 30  # 第7次及以后：30天后
         
-        for word, data in self.words.items():
+        # 按复习阶段分组遍历，未复习和复习中的单词不用逐个判断复习次数
+        unreviewed = list(self._levels[0])
+        for word in unreviewed:
+            # 未复习的单词：全部加入
+            if self.words[word].get("last_review_date", "") == today_str:
+                self.today_completed.add(word)
+        
+        for word in self._levels[1]:
+            # 复习中的单词（1-2次）：全部加入
+            data = self.words[word]
+            if data.get("last_review_date", "") == today_str:
+                self.today_completed.add(word)
+            reviewing.append((data["review_count"], word))
+        
+        for word in self._levels[2]:
+            # 已掌握的单词（>=3次）：根据艾宾浩斯曲线判断
+            data = self.words[word]
             last_review_date = data.get("last_review_date", "")
-            review_count = data.get("review_count", 0)
+            review_count = data["review_count"]
+            mastered.append((review_count, word))
             
-            if review_count == 0:
-                # 未复习的单词：全部加入
-                if last_review_date == today.strftime("%Y-%m-%d"):
-                    self.today_completed.add(word)
-                unreviewed.append(word)
-            elif review_count < 3:
-                # 复习中的单词（1-2次）：全部加入
-                if last_review_date == today.strftime("%Y-%m-%d"):
-                    self.today_completed.add(word)
-                reviewing.append(word)
+            # 检查是否到期
+            if last_review_date:
+                try:
+                    last_date = _parse_date(last_review_date)
+                    days_since_review = (today - last_date).days
+                    
+                    # 获取应该的复习间隔
+                    required_interval = ebbinghaus_intervals.get(review_count, default_interval)
+                    
+                    # 如果距离上次复习已经达到或超过间隔天数，加入到期列表
+                    if days_since_review >= required_interval:
+                        mastered_due.add(word)
+                        # 如果今天已复习过，标记为已完成
+                        if last_review_date == today_str:
+                            self.today_completed.add(word)
+                except:
+                    # 如果日期解析失败，加入到期列表
+                    mastered_due.add(word)
             else:
-                # 已掌握的单词（>=3次）：根据艾宾浩斯曲线判断
-                mastered.append(word)
-                
-                # 检查是否到期
-                if last_review_date:
-                    try:
-                        last_date = datetime.strptime(last_review_date, "%Y-%m-%d").date()
-                        days_since_review = (today - last_date).days
-                        
-                        # 获取应该的复习间隔
-                        required_interval = ebbinghaus_intervals.get(review_count, default_interval)
-                        
-                        # 如果距离上次复习已经达到或超过间隔天数，加入到期列表
-                        if days_since_review >= required_interval:
-                            mastered_due.append(word)
-                            # 如果今天已复习过，标记为已完成
-                            if last_review_date == today.strftime("%Y-%m-%d"):
-                                self.today_completed.add(word)
-                    except:
-                        # 如果日期解析失败，加入到期列表
-                        mastered_due.append(word)
-                else:
-                    # 如果没有复习日期，加入到期列表
-                    mastered_due.append(word)
+                # 如果没有复习日期，加入到期列表
+                mastered_due.add(word)
         
         # 1. 未复习的单词：全部加入
         unreviewed.sort()
-        reviewing.sort(key=lambda w: (self.words[w]["review_count"], w))
-        mastered.sort(key=lambda w: (self.words[w]["review_count"], w))
+        reviewing.sort()
+        # 已掌握的单词只排序一次（复习次数少的优先），再按是否到期拆分，两部分仍然有序
+        mastered.sort()
+        mastered_due_sorted = [w for _, w in mastered if w in mastered_due]
+        not_due_sorted = [w for _, w in mastered if w not in mastered_due]
         self.today_tasks.extend(unreviewed)
         
         # 2. 复习中的单词：全部加入
-        self.today_tasks.extend(reviewing)
+        self.today_tasks.extend(w for _, w in reviewing)
         
         # 检查当前任务数量，如果已经超过60个，不再添加已掌握的单词
         current_count = len(self.today_tasks)
@@ -323,9 +870,7 @@ class WordManager:
             remaining_slots = max_total - current_count
             
             # 3. 已掌握的单词：优先加入到期的，不足10个则随机补充
-            if mastered_due:
-                # 按复习次数排序，复习次数少的优先
-                mastered_due_sorted = sorted(mastered_due, key=lambda w: (self.words[w]["review_count"], w))
+            if mastered_due_sorted:
                 # 限制数量不超过剩余槽位
                 add_count = min(len(mastered_due_sorted), remaining_slots)
                 self.today_tasks.extend(mastered_due_sorted[:add_count])
@@ -334,11 +879,9 @@ class WordManager:
             added_mastered = min(len(mastered_due), remaining_slots)
             if added_mastered < 10 and added_mastered < remaining_slots and mastered:
                 # 从未到期的已掌握单词中随机选择
-                not_due = [w for w in mastered if w not in mastered_due]
-                if not_due:
+                if not_due_sorted:
                     # 使用日期作为种子，保证每天固定
-                    # 按复习次数排序，优先选择复习次数少的
-                    not_due_sorted = sorted(not_due, key=lambda w: (self.words[w]["review_count"], w))
+                    # 已按复习次数排序，优先选择复习次数少的
                     # 从前30%中随机选择
                     candidate_count = max(10, len(not_due_sorted) // 3)
                     candidates = not_due_sorted[:candidate_count]
@@ -350,18 +893,48 @@ class WordManager:
                     
                     # 检查这些单词今天是否已复习
                     for word in sampled:
-                        if self.words[word].get("last_review_date", "") == today.strftime("%Y-%m-%d"):
+                        if self.words[word].get("last_review_date", "") == today_str:
                             self.today_completed.add(word)
                     
         
         # 打乱顺序
         day_rng.shuffle(self.today_tasks)
+        self._review_queue = deque(w for w in self.today_tasks if w not in self.today_completed)
     
     def get_mastered_words(self):
-        return {w: d for w, d in self.words.items() if d["review_count"] >= 3}
+        return {w: self.words[w] for w in self._levels[2]}
     
     def get_unreviewed_words(self):
-        return {w: d for w, d in self.words.items() if d["review_count"] == 0}
+        return {w: self.words[w] for w in self._levels[0]}
+    
+    def get_reviewing_words(self):
+        return {w: self.words[w] for w in self._levels[1]}
+    
+    @property
+    def total_count(self):
+        return len(self.words)
+    
+    @property
+    def today_total(self):
+        """今日任务总数"""
+        return len(self.today_tasks)
+    
+    @property
+    def today_done(self):
+        """今日已完成数"""
+        return len(self.today_completed)
+    
+    @property
+    def unreviewed_count(self):
+        return len(self._levels[0])
+    
+    @property
+    def reviewing_count(self):
+        return len(self._levels[1])
+    
+    @property
+    def mastered_count(self):
+        return len(self._levels[2])
 
     def import_from_text(self, text):
         count = 0
@@ -373,9 +946,7 @@ class WordManager:
                 if len(parts) == 2 and parts[0].strip() != '单词':
                     word = parts[0].strip()
                     # 检查是否已存在（不区分大小写）
-                    word_lower = word.lower()
-                    exists = any(w.lower() == word_lower for w in self.words.keys())
-                    if exists:
+                    if self.has_word_ignore_case(word):
                         skipped += 1
                         continue
                     success, meaning = self.add_word(word, parts[1])
@@ -384,13 +955,28 @@ class WordManager:
                         added_words.append((word, meaning))
         return count, added_words, skipped
     
-    def export_to_text(self):
-        lines = ["单词,详细含义"]
+    def iter_export_lines(self):
+        """逐行生成导出内容，写文件时不用先拼出整个字符串"""
+        yield "单词,详细含义\n"
         for word, data in self.words.items():
-            lines.append(f"{word},{data['meaning']}")
-        return '\n'.join(lines)
+            yield f"{word},{data['meaning']}\n"
+    
+    def export_to_text(self):
+        return ''.join(self.iter_export_lines())
     
     def fetch_meaning(self, word):
+        """获取单词含义和例句，优先使用本地缓存"""
+        cached = self.fetch_cache.get(word)
+        if cached is not None:
+            return cached
+        
+        meaning, examples = self._fetch_meaning_online(word)
+        # 查不到释义时不缓存，下次导入会重新联网查询
+        if meaning:
+            self.fetch_cache.put(word, meaning, examples)
+        return meaning, examples
+    
+    def _fetch_meaning_online(self, word):
         """联网获取单词含义和例句"""
         meaning = ""
         examples = []
@@ -398,32 +984,30 @@ class WordManager:
         # 1. 使用有道词典jsonp接口获取完整释义和例句
         try:
             url = f"https://dict.youdao.com/jsonapi?q={urllib.parse.quote(word)}"
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=8) as resp:
-                data = json.loads(resp.read().decode('utf-8'))
-                
-                # 获取释义
-                ec = data.get("ec", {})
-                if ec:
-                    word_list = ec.get("word", [])
-                    if word_list:
-                        trs = word_list[0].get("trs", [])
-                        meanings = []
-                        for tr in trs:
-                            for t in tr.get("tr", []):
-                                if t.get("l", {}).get("i"):
-                                    meanings.append(t["l"]["i"][0])
-                        if meanings:
-                            meaning = "; ".join(meanings)
-                
-                # 获取例句（从blng双语例句，只保留英文）
-                blng = data.get("blng", {})
-                if blng:
-                    blng_sents = blng.get("blng_sents_part", {}).get("sentence-pair", [])
-                    for sent in blng_sents[:3]:  # 最多取3个例句
-                        en = sent.get("sentence", "")
-                        if en:
-                            examples.append({"en": en, "cn": ""})
+            data = decode_json(http_get(url, timeout=8))
+            
+            # 获取释义
+            ec = data.get("ec", {})
+            if ec:
+                word_list = ec.get("word", [])
+                if word_list:
+                    trs = word_list[0].get("trs", [])
+                    meanings = []
+                    for tr in trs:
+                        for t in tr.get("tr", []):
+                            if t.get("l", {}).get("i"):
+                                meanings.append(t["l"]["i"][0])
+                    if meanings:
+                        meaning = "; ".join(meanings)
+            
+            # 获取例句（从blng双语例句，只保留英文）
+            blng = data.get("blng", {})
+            if blng:
+                blng_sents = blng.get("blng_sents_part", {}).get("sentence-pair", [])
+                for sent in blng_sents[:3]:  # 最多取3个例句
+                    en = sent.get("sentence", "")
+                    if en:
+                        examples.append({"en": en, "cn": ""})
         except:
             pass
         
@@ -431,13 +1015,11 @@ class WordManager:
         if not meaning:
             try:
                 url = f"https://dict.youdao.com/suggest?num=1&doctype=json&q={urllib.parse.quote(word)}"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                with urllib.request.urlopen(req, timeout=5) as resp:
-                    data = json.loads(resp.read().decode('utf-8'))
-                    if data.get("result", {}).get("code") == 200:
-                        entries = data.get("data", {}).get("entries", [])
-                        if entries and entries[0].get("explain"):
-                            meaning = entries[0]["explain"]
+                data = decode_json(http_get(url, timeout=5))
+                if data.get("result", {}).get("code") == 200:
+                    entries = data.get("data", {}).get("entries", [])
+                    if entries and entries[0].get("explain"):
+                        meaning = entries[0]["explain"]
             except:
                 pass
         
@@ -445,28 +1027,26 @@ class WordManager:
         if not examples:
             try:
                 url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{urllib.parse.quote(word)}"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                with urllib.request.urlopen(req, timeout=5) as resp:
-                    data = json.loads(resp.read().decode('utf-8'))
-                    if isinstance(data, list) and data:
-                        meanings_data = data[0].get("meanings", [])
-                        # 获取释义（如果还没有）
-                        if not meaning and meanings_data:
-                            defs = meanings_data[0].get("definitions", [])
-                            if defs:
-                                meaning = defs[0].get("definition", "")
-                        
-                        # 获取例句
-                        for meaning_item in meanings_data:
-                            defs = meaning_item.get("definitions", [])
-                            for d in defs:
-                                example = d.get("example", "")
-                                if example:
-                                    examples.append({"en": example, "cn": ""})
-                                    if len(examples) >= 3:
-                                        break
-                            if len(examples) >= 3:
-                                break
+                data = decode_json(http_get(url, timeout=5))
+                if isinstance(data, list) and data:
+                    meanings_data = data[0].get("meanings", [])
+                    # 获取释义（如果还没有）
+                    if not meaning and meanings_data:
+                        defs = meanings_data[0].get("definitions", [])
+                        if defs:
+                            meaning = defs[0].get("definition", "")
+                    
+                    # 获取例句
+                    for meaning_item in meanings_data:
+                        defs = meaning_item.get("definitions", [])
+                        for d in defs:
+                            example = d.get("example", "")
+                            if example:
+                                examples.append({"en": example, "cn": ""})
+                                if len(examples) >= 3:
+                                    break
+                        if len(examples) >= 3:
+                            break
             except:
                 pass
         
@@ -474,16 +1054,14 @@ class WordManager:
         if not examples or len(examples) < 3:
             try:
                 url = f"https://tatoeba.org/en/api_v0/search?from=eng&to=zho&query={urllib.parse.quote(word)}"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                with urllib.request.urlopen(req, timeout=5) as resp:
-                    data = json.loads(resp.read().decode('utf-8'))
-                    results = data.get("results", [])
-                    for item in results[:5]:
-                        eng_text = item.get("text", "")
-                        if eng_text and len(eng_text) < 200:
-                            examples.append({"en": eng_text, "cn": ""})
-                            if len(examples) >= 3:
-                                break
+                data = decode_json(http_get(url, timeout=5))
+                results = data.get("results", [])
+                for item in results[:5]:
+                    eng_text = item.get("text", "")
+                    if eng_text and len(eng_text) < 200:
+                        examples.append({"en": eng_text, "cn": ""})
+                        if len(examples) >= 3:
+                            break
             except:
                 pass
         
@@ -491,20 +1069,15 @@ class WordManager:
         if not examples:
             try:
                 url = f"https://www.vocabulary.com/dictionary/{urllib.parse.quote(word.lower())}"
-                req = urllib.request.Request(url, headers={
+                chunks = http_stream(url, timeout=5, headers={
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 })
-                with urllib.request.urlopen(req, timeout=5) as resp:
-                    html = resp.read().decode('utf-8')
-                    import re
-                    # Vocabulary.com的例句模式
-                    matches = re.findall(r'<h3 class="example">([^<]+)</h3>', html)
-                    for match in matches[:3]:
-                        sentence = match.strip()
-                        if sentence and 10 < len(sentence) < 200:
-                            examples.append({"en": sentence, "cn": ""})
-                            if len(examples) >= 3:
-                                break
+                for match in _iter_vocabulary_examples(chunks, 3):
+                    sentence = match.strip()
+                    if sentence and 10 < len(sentence) < 200:
+                        examples.append({"en": sentence, "cn": ""})
+                        if len(examples) >= 3:
+                            break
             except:
                 pass
         
@@ -519,21 +1092,24 @@ class WordManager:
         if not meaning:
             meaning = "(未找到释义)"
         
-        self.words[word] = {
-            "meaning": meaning,
-            "examples": examples,
-            "review_count": 0,
-            "last_review": "",
-            "last_review_date": "",
-            "today_reviewed": False
-        }
-        self.save_data()
+        with self._lock:
+            if word in self.words:
+                return False, ""
+            self.words[word] = {
+                "meaning": meaning,
+                "examples": examples,
+                "review_count": 0,
+                "last_review": "",
+                "last_review_date": "",
+                "today_reviewed": False
+            }
+            self._index_word(word)
         return True, meaning
 
     def import_words_only(self, text):
-        """只导入单词和词组 - 高鲁棒性提取"""
-        import re
-        words = set()
+        """只导入单词和词组 - 高鲁棒性提取，出现次数多的排在前面"""
+        words = []
+        freq = Counter()  # 本次提取的单词（不区分大小写）-> 出现次数
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         skip_words = {'单词', 'word', 'words', '词汇', '英语', 'english', 'vocabulary', 
                       '详细含义', '含义', '意思', 'meaning', 'definition'}
@@ -544,7 +1120,7 @@ class WordManager:
                 continue
             
             # 先尝试按逗号、分号等分隔
-            parts = re.split(r'[,;，；\t、/|]+', line)
+            parts = _SPLIT_RE.split(line)
             for part in parts:
                 part = part.strip()
                 if not part:
@@ -552,29 +1128,151 @@ class WordManager:
                 
                 # 检查是否是词组（包含空格的英文）
                 # 匹配：next of kin, take care of, etc.
-                phrase_match = re.match(r'^[A-Za-z]+(?:\s+[A-Za-z]+)+$', part)
+                phrase_match = _PHRASE_RE.match(part)
                 if phrase_match:
                     phrase = part
                     phrase_lower = phrase.lower()
-                    exists = any(w.lower() == phrase_lower for w in self.words.keys())
                     if (len(phrase) >= 3 and 
-                        phrase.lower() not in skip_words and
-                        not exists):
-                        words.add(phrase)
+                        phrase_lower not in skip_words and
+                        phrase_lower not in self._lower_index):
+                        if phrase_lower not in freq:
+                            words.append(phrase)
+                        freq[phrase_lower] += 1
                     continue
                 
                 # 否则按单词提取
-                matches = re.findall(r"[A-Za-z]+(?:[-'][A-Za-z]+)*", part)
+                matches = _WORD_RE.findall(part)
                 for word in matches:
                     word = word.strip("'-")
                     word_lower = word.lower()
-                    exists = any(w.lower() == word_lower for w in self.words.keys())
                     if (len(word) >= 2 and 
                         not word.isdigit() and 
-                        word.lower() not in skip_words and
-                        not exists):
-                        words.add(word)
-        return list(words)
+                        word_lower not in skip_words and
+                        word_lower not in self._lower_index):
+                        if word_lower not in freq:
+                            words.append(word)
+                        freq[word_lower] += 1
+        # 按出现次数排序（次数相同保持原文顺序），中途取消查词时常见词已先导入
+        words.sort(key=lambda w: -freq[w.lower()])
+        return words
+
+
+class WordTableModel(QAbstractTableModel):
+    """单词表格的数据模型 - 直接读取WordManager的数据，视图只渲染可见行"""
+    HEADERS = ["单词", "含义", "例句", "复习次数", "上次复习"]
+    EDITABLE_COLUMNS = (1, 2)  # 只有含义和例句可编辑
+    EXAMPLE_CACHE_SIZE = 200  # 例句文本缓存条数，约为几屏可见行
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self._keys = []  # 当前显示的单词
+        self._rows = {}  # 单词 -> 行号
+        self._edits = {}  # 未保存的修改 {单词: {列: 文本}}
+        self._example_cache = OrderedDict()  # 拼接好的例句文本 {单词: (例句列表, 文本)}
+
+    def set_words(self, words):
+        """重新设置显示的单词（筛选条件或数据变化后调用）"""
+        self.beginResetModel()
+        self._keys = list(words)
+        self._rows = {word: row for row, word in enumerate(self._keys)}
+        # 丢弃已删除单词的未保存修改
+        self._edits = {w: e for w, e in self._edits.items() if w in self.manager.words}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() in self.EDITABLE_COLUMNS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        word = self._keys[index.row()]
+        col = index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            edits = self._edits.get(word)
+            if edits and col in edits:
+                return edits[col]
+            info = self.manager.words.get(word)
+            if info is None:
+                return None
+            if col == 0:
+                return word
+            if col == 1:
+                return info["meaning"]
+            if col == 2:
+                return self._example_text(word, info.get("examples", []))
+            if col == 3:
+                return info["review_count"]  # 使用数字以便正确排序
+            return info["last_review"] or "-"
+        if role == Qt.TextAlignmentRole and col in (3, 4):
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole and word in self._edits:
+            return QBrush(Qt.yellow)  # 已修改未保存的行
+        if role == Qt.UserRole:
+            return word
+        return None
+
+    def _example_text(self, word, examples):
+        """显示完整例句，用空行分隔 - 只在视图请求时拼接，并缓存最近用到的行"""
+        cached = self._example_cache.get(word)
+        # 例句修改时总是整体替换列表，对象不同即说明缓存已过期
+        if cached is not None and cached[0] is examples:
+            self._example_cache.move_to_end(word)
+            return cached[1]
+        text = "\n\n".join(ex.get("en", "") for ex in examples)
+        self._example_cache[word] = (examples, text)
+        if len(self._example_cache) > self.EXAMPLE_CACHE_SIZE:
+            self._example_cache.popitem(last=False)
+        return text
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or index.column() not in self.EDITABLE_COLUMNS:
+            return False
+        word = self._keys[index.row()]
+        info = self.manager.words.get(word)
+        if info is None:
+            return False
+        col = index.column()
+        stored = info["meaning"] if col == 1 else self._example_text(word, info.get("examples", []))
+        edits = self._edits.get(word, {})
+        if value == edits.get(col, stored):
+            return True  # 内容没有变化，不标记
+        if value == stored:
+            # 改回了原来的内容，撤销该列的修改，整行都没有修改时取消标记
+            del edits[col]
+            if not edits:
+                del self._edits[word]
+        else:
+            self._edits.setdefault(word, {})[col] = value
+        # 刷新整行的修改标记
+        row = index.row()
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return True
+
+    def take_edits(self):
+        """取出所有未保存的修改，并清除修改标记"""
+        edits = self._edits
+        self._edits = {}
+        # 只刷新修改过的行
+        for word in edits:
+            row = self._rows.get(word)
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return edits
 
 
 class MainWindow(QMainWindow):
@@ -583,35 +1281,65 @@ class MainWindow(QMainWindow):
         self.manager = WordManager()
         self.current_word = None
         self.fetch_thread = None
+        self.backup_thread = None
         self.media_player = QMediaPlayer()  # 音频播放器
+        self.audio_threads = {}  # 正在下载发音的线程 {单词: 线程}
+        self._today_refresh_pending = False  # 已安排重算今日任务
+        self._stats_dirty = True  # 单词表格需要刷新（切换到统计页时再刷新）
         self.init_ui()
         
-        # 检查是否需要备份到MySQL
-        self.check_and_backup()
+        # 窗口显示后再检查是否需要备份到MySQL
+        QTimer.singleShot(100, self.check_and_backup)
+    
+    def closeEvent(self, event):
+        try:
+            self.manager.save_data(sync=True)
+        except OSError as e:
+            reply = QMessageBox.warning(
+                self, "保存失败",
+                f"保存单词数据失败：{e}\n\n"
+                "点击「重试」返回程序，关闭占用数据文件的程序后再次关闭窗口即可重新保存；\n"
+                "点击「关闭」放弃未保存的修改并退出。",
+                QMessageBox.Retry | QMessageBox.Close, QMessageBox.Retry
+            )
+            if reply == QMessageBox.Retry:
+                event.ignore()
+                return
+        if self.backup_thread is not None:
+            self.backup_thread.wait()
+        super().closeEvent(event)
     
     def check_and_backup(self):
-        """检查并执行每日备份"""
+        """检查并执行每日备份（在后台线程中进行，不阻塞界面）"""
+        self.manager.flush()
         if should_backup_today() and self.manager.words:
-            success, message = backup_to_mysql(self.manager.words)
-            # 写入日志文件
-            log_file = "backup_log.txt"
-            with open(log_file, 'a', encoding='utf-8') as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"[{timestamp}] {message}\n")
-            
-            # 弹窗提示
-            if success:
-                QMessageBox.information(self, "备份成功", message)
-            else:
-                QMessageBox.warning(self, "备份失败", message)
+            # 备份线程使用数据快照，复习时的修改不影响正在进行的备份
+            snapshot = {word: dict(data) for word, data in self.manager.words.items()}
+            self.backup_thread = BackupWorker(snapshot)
+            self.backup_thread.finished.connect(self._on_backup_finished)
+            self.backup_thread.start()
+    
+    def _on_backup_finished(self, success, message):
+        # 写入日志文件
+        log_file = "backup_log.txt"
+        with open(log_file, 'a', encoding='utf-8') as f:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            f.write(f"[{timestamp}] {message}\n")
+        
+        # 弹窗提示
+        if success:
+            QMessageBox.information(self, "备份成功", message)
+        else:
+            QMessageBox.warning(self, "备份失败", message)
     
     def init_ui(self):
         self.setWindowTitle("背单词助手")
         self.resize(1200, 900)
         self.setMinimumSize(1000, 800)
+        self.setStyleSheet(BUTTON_STYLE_SHEET)
         
         # 设置全局字体
-        font = QFont("Microsoft YaHei", 11)
+        font = ui_font(11)
         self.setFont(font)
         
         central = QWidget()
@@ -621,14 +1349,17 @@ class MainWindow(QMainWindow):
         layout.setSpacing(10)
         
         # 标签页
-        tabs = QTabWidget()
-        tabs.setFont(QFont("Microsoft YaHei", 12))
-        tabs.addTab(self.create_review_tab(), "复习")
-        tabs.addTab(self.create_import_tab(), "导入/导出")
-        tabs.addTab(self.create_stats_tab(), "统计/管理")
-        layout.addWidget(tabs)
-        
-        self.update_stats()
+        self.tabs = QTabWidget()
+        self.tabs.setFont(ui_font(12))
+        self.tabs.addTab(self.create_review_tab(), "复习")
+        self.tabs.addTab(self.create_import_tab(), "导入/导出")
+        self.stats_tab = self.create_stats_tab()
+        self.tabs.addTab(self.stats_tab, "统计/管理")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        layout.addWidget(self.tabs)
+        
+        # 今日任务的计算推迟到窗口显示之后
+        QTimer.singleShot(0, self.update_stats)
 
     def create_review_tab(self):
         widget = QWidget()
@@ -637,13 +1368,13 @@ class MainWindow(QMainWindow):
         
         # 统计信息
         self.stats_label = QLabel()
-        self.stats_label.setFont(QFont("Microsoft YaHei", 12))
+        self.stats_label.setFont(ui_font(12))
         self.stats_label.setStyleSheet("padding: 10px; background: #e8f4fd; border-radius: 5px;")
         layout.addWidget(self.stats_label)
         
         # 单词显示区
         word_group = QGroupBox("当前单词")
-        word_group.setFont(QFont("Microsoft YaHei", 11))
+        word_group.setFont(ui_font(11))
         word_layout = QVBoxLayout(word_group)
         word_layout.setContentsMargins(20, 20, 20, 20)
         
@@ -652,7 +1383,7 @@ class MainWindow(QMainWindow):
         word_container.addStretch()
         
         self.word_label = QLabel("点击「开始复习」开始")
-        self.word_label.setFont(QFont("Microsoft YaHei", 28, QFont.Bold))
+        self.word_label.setFont(ui_font(28, bold=True))
         self.word_label.setAlignment(Qt.AlignCenter)
         self.word_label.setMinimumHeight(120)  # 增加高度以容纳复习次数
         self.word_label.setWordWrap(True)  # 允许换行
@@ -692,9 +1423,9 @@ class MainWindow(QMainWindow):
         # 开始复习按钮
         start_btn_layout = QHBoxLayout()
         self.start_review_btn = QPushButton("开始复习")
-        self.start_review_btn.setFont(QFont("Microsoft YaHei", 14, QFont.Bold))
+        self.start_review_btn.setFont(ui_font(14, bold=True))
         self.start_review_btn.setMinimumHeight(50)
-        self.start_review_btn.setStyleSheet("background: #007bff; color: white; border: none; border-radius: 5px;")
+        self.start_review_btn.setProperty("class", "primary")
         self.start_review_btn.clicked.connect(self.start_review)
         start_btn_layout.addWidget(self.start_review_btn)
         layout.addLayout(start_btn_layout)
@@ -702,10 +1433,10 @@ class MainWindow(QMainWindow):
         # 输入区
         input_layout = QHBoxLayout()
         input_label = QLabel("输入含义:")
-        input_label.setFont(QFont("Microsoft YaHei", 11))
+        input_label.setFont(ui_font(11))
         input_layout.addWidget(input_label)
         self.answer_input = QLineEdit()
-        self.answer_input.setFont(QFont("Microsoft YaHei", 12))
+        self.answer_input.setFont(ui_font(12))
         self.answer_input.setMinimumHeight(35)
         self.answer_input.setPlaceholderText("输入单词的中文含义...")
         self.answer_input.returnPressed.connect(self.check_answer)
@@ -714,7 +1445,7 @@ class MainWindow(QMainWindow):
         
         # 结果显示
         self.result_label = QLabel()
-        self.result_label.setFont(QFont("Microsoft YaHei", 11))
+        self.result_label.setFont(ui_font(11))
         self.result_label.setWordWrap(True)
         self.result_label.setMinimumHeight(80)
         self.result_label.setStyleSheet("padding: 10px; background: #f5f5f5; border-radius: 5px;")
@@ -722,12 +1453,12 @@ class MainWindow(QMainWindow):
         
         # 例句显示和编辑
         example_group = QGroupBox("例句")
-        example_group.setFont(QFont("Microsoft YaHei", 11))
+        example_group.setFont(ui_font(11))
         example_layout = QVBoxLayout(example_group)
         
         # 使用 QTextEdit 替代 QLabel，支持编辑和复制
         self.example_text = QTextEdit()
-        self.example_text.setFont(QFont("Microsoft YaHei", 10))
+        self.example_text.setFont(ui_font(10))
         self.example_text.setMinimumHeight(120)
         self.example_text.setMaximumHeight(200)
         self.example_text.setStyleSheet("padding: 10px; background: #fff; border-radius: 5px;")
@@ -736,9 +1467,10 @@ class MainWindow(QMainWindow):
         
         # 保存例句按钮
         save_example_btn = QPushButton("保存例句修改")
-        save_example_btn.setFont(QFont("Microsoft YaHei", 10))
+        save_example_btn.setFont(ui_font(10))
         save_example_btn.setMinimumHeight(32)
-        save_example_btn.setStyleSheet("background: #28a745; color: white; border: none; border-radius: 4px;")
+        save_example_btn.setProperty("class", "success")
+        save_example_btn.setProperty("variant", "small")
         save_example_btn.clicked.connect(self.save_example_changes)
         example_layout.addWidget(save_example_btn)
         
@@ -749,26 +1481,26 @@ class MainWindow(QMainWindow):
         btn_layout.setSpacing(15)
         
         check_btn = QPushButton("检查答案")
-        check_btn.setFont(QFont("Microsoft YaHei", 11))
+        check_btn.setFont(ui_font(11))
         check_btn.setMinimumHeight(40)
         check_btn.setMinimumWidth(120)
-        check_btn.setStyleSheet("background: #28a745; color: white; border: none; border-radius: 5px;")
+        check_btn.setProperty("class", "success")
         check_btn.clicked.connect(self.check_answer)
         btn_layout.addWidget(check_btn)
         
         show_answer_btn = QPushButton("显示答案")
-        show_answer_btn.setFont(QFont("Microsoft YaHei", 11))
+        show_answer_btn.setFont(ui_font(11))
         show_answer_btn.setMinimumHeight(40)
         show_answer_btn.setMinimumWidth(120)
-        show_answer_btn.setStyleSheet("background: #6c757d; color: white; border: none; border-radius: 5px;")
+        show_answer_btn.setProperty("class", "secondary")
         show_answer_btn.clicked.connect(self.show_answer)
         btn_layout.addWidget(show_answer_btn)
         
         show_example_btn = QPushButton("显示例句")
-        show_example_btn.setFont(QFont("Microsoft YaHei", 11))
+        show_example_btn.setFont(ui_font(11))
         show_example_btn.setMinimumHeight(40)
         show_example_btn.setMinimumWidth(120)
-        show_example_btn.setStyleSheet("background: #17a2b8; color: white; border: none; border-radius: 5px;")
+        show_example_btn.setProperty("class", "info")
         show_example_btn.clicked.connect(self.show_examples)
         btn_layout.addWidget(show_example_btn)
         
@@ -779,17 +1511,17 @@ class MainWindow(QMainWindow):
         btn_layout2.setSpacing(15)
         
         self.know_btn = QPushButton("✓ 我会了")
-        self.know_btn.setFont(QFont("Microsoft YaHei", 12, QFont.Bold))
+        self.know_btn.setFont(ui_font(12, bold=True))
         self.know_btn.setMinimumHeight(50)
-        self.know_btn.setStyleSheet("background: #28a745; color: white; border: none; border-radius: 5px;")
+        self.know_btn.setProperty("class", "success")
         self.know_btn.clicked.connect(self.mark_as_known)
         self.know_btn.setVisible(False)  # 初始隐藏
         btn_layout2.addWidget(self.know_btn)
         
         self.dont_know_btn = QPushButton("✗ 我还不会")
-        self.dont_know_btn.setFont(QFont("Microsoft YaHei", 12, QFont.Bold))
+        self.dont_know_btn.setFont(ui_font(12, bold=True))
         self.dont_know_btn.setMinimumHeight(50)
-        self.dont_know_btn.setStyleSheet("background: #dc3545; color: white; border: none; border-radius: 5px;")
+        self.dont_know_btn.setProperty("class", "danger")
         self.dont_know_btn.clicked.connect(self.mark_as_unknown)
         self.dont_know_btn.setVisible(False)  # 初始隐藏
         btn_layout2.addWidget(self.dont_know_btn)
@@ -805,12 +1537,12 @@ class MainWindow(QMainWindow):
         
         # 文本输入区
         tip_label = QLabel("支持多种格式：每行一个单词、空格/逗号分隔、或直接粘贴英文文章")
-        tip_label.setFont(QFont("Microsoft YaHei", 10))
+        tip_label.setFont(ui_font(10))
         tip_label.setStyleSheet("color: #666;")
         layout.addWidget(tip_label)
         
         self.import_text = QTextEdit()
-        self.import_text.setFont(QFont("Microsoft YaHei", 11))
+        self.import_text.setFont(ui_font(11))
         self.import_text.setMinimumHeight(150)
         self.import_text.setPlaceholderText("例如:\napple banana orange\n\n或:\napple,苹果\nbanana,香蕉")
         layout.addWidget(self.import_text)
@@ -820,16 +1552,16 @@ class MainWindow(QMainWindow):
         btn_layout1.setSpacing(10)
         
         import_auto_btn = QPushButton("导入单词 (自动查词)")
-        import_auto_btn.setFont(QFont("Microsoft YaHei", 11))
+        import_auto_btn.setFont(ui_font(11))
         import_auto_btn.setMinimumHeight(38)
-        import_auto_btn.setStyleSheet("background: #007bff; color: white; border: none; border-radius: 5px;")
+        import_auto_btn.setProperty("class", "primary")
         import_auto_btn.clicked.connect(self.import_words_auto)
         btn_layout1.addWidget(import_auto_btn)
         
         import_text_btn = QPushButton("导入 (带含义)")
-        import_text_btn.setFont(QFont("Microsoft YaHei", 11))
+        import_text_btn.setFont(ui_font(11))
         import_text_btn.setMinimumHeight(38)
-        import_text_btn.setStyleSheet("background: #6c757d; color: white; border: none; border-radius: 5px;")
+        import_text_btn.setProperty("class", "secondary")
         import_text_btn.clicked.connect(self.import_from_text)
         btn_layout1.addWidget(import_text_btn)
         layout.addLayout(btn_layout1)
@@ -839,23 +1571,23 @@ class MainWindow(QMainWindow):
         btn_layout2.setSpacing(10)
         
         import_file_btn = QPushButton("从文件导入")
-        import_file_btn.setFont(QFont("Microsoft YaHei", 11))
+        import_file_btn.setFont(ui_font(11))
         import_file_btn.setMinimumHeight(38)
-        import_file_btn.setStyleSheet("background: #17a2b8; color: white; border: none; border-radius: 5px;")
+        import_file_btn.setProperty("class", "info")
         import_file_btn.clicked.connect(self.import_from_file_auto)
         btn_layout2.addWidget(import_file_btn)
         
         import_clip_btn = QPushButton("从剪贴板导入")
-        import_clip_btn.setFont(QFont("Microsoft YaHei", 11))
+        import_clip_btn.setFont(ui_font(11))
         import_clip_btn.setMinimumHeight(38)
-        import_clip_btn.setStyleSheet("background: #17a2b8; color: white; border: none; border-radius: 5px;")
+        import_clip_btn.setProperty("class", "info")
         import_clip_btn.clicked.connect(self.import_from_clipboard_auto)
         btn_layout2.addWidget(import_clip_btn)
         
         export_btn = QPushButton("导出到文件")
-        export_btn.setFont(QFont("Microsoft YaHei", 11))
+        export_btn.setFont(ui_font(11))
         export_btn.setMinimumHeight(38)
-        export_btn.setStyleSheet("background: #28a745; color: white; border: none; border-radius: 5px;")
+        export_btn.setProperty("class", "success")
         export_btn.clicked.connect(self.export_to_file)
         btn_layout2.addWidget(export_btn)
         
@@ -873,11 +1605,11 @@ class MainWindow(QMainWindow):
         toolbar.setSpacing(10)
         
         filter_label = QLabel("筛选:")
-        filter_label.setFont(QFont("Microsoft YaHei", 11))
+        filter_label.setFont(ui_font(11))
         toolbar.addWidget(filter_label)
         
         self.filter_combo = QComboBox()
-        self.filter_combo.setFont(QFont("Microsoft YaHei", 11))
+        self.filter_combo.setFont(ui_font(11))
         self.filter_combo.setMinimumWidth(150)
         self.filter_combo.setMinimumHeight(32)
         self.filter_combo.addItems(["全部单词", "未复习", "复习中(1-2次)", "已掌握(>=3次)"])
@@ -885,48 +1617,56 @@ class MainWindow(QMainWindow):
         toolbar.addWidget(self.filter_combo)
         
         refresh_btn = QPushButton("刷新")
-        refresh_btn.setFont(QFont("Microsoft YaHei", 11))
+        refresh_btn.setFont(ui_font(11))
         refresh_btn.setMinimumHeight(32)
-        refresh_btn.setStyleSheet("background: #007bff; color: white; border: none; border-radius: 4px; padding: 5px 15px;")
+        refresh_btn.setProperty("class", "primary")
+        refresh_btn.setProperty("variant", "toolbar")
         refresh_btn.clicked.connect(self.update_table)
         toolbar.addWidget(refresh_btn)
         
         toolbar.addStretch()
         
         delete_btn = QPushButton("删除选中")
-        delete_btn.setFont(QFont("Microsoft YaHei", 11))
+        delete_btn.setFont(ui_font(11))
         delete_btn.setMinimumHeight(32)
-        delete_btn.setStyleSheet("background: #dc3545; color: white; border: none; border-radius: 4px; padding: 5px 15px;")
+        delete_btn.setProperty("class", "danger")
+        delete_btn.setProperty("variant", "toolbar")
         delete_btn.clicked.connect(self.delete_selected_words)
         toolbar.addWidget(delete_btn)
         
         delete_all_btn = QPushButton("清空全部")
-        delete_all_btn.setFont(QFont("Microsoft YaHei", 11))
+        delete_all_btn.setFont(ui_font(11))
         delete_all_btn.setMinimumHeight(32)
-        delete_all_btn.setStyleSheet("background: #dc3545; color: white; border: none; border-radius: 4px; padding: 5px 15px;")
+        delete_all_btn.setProperty("class", "danger")
+        delete_all_btn.setProperty("variant", "toolbar")
         delete_all_btn.clicked.connect(self.delete_all_words)
         toolbar.addWidget(delete_all_btn)
         
         save_btn = QPushButton("保存修改")
-        save_btn.setFont(QFont("Microsoft YaHei", 11))
+        save_btn.setFont(ui_font(11))
         save_btn.setMinimumHeight(32)
-        save_btn.setStyleSheet("background: #28a745; color: white; border: none; border-radius: 4px; padding: 5px 15px;")
+        save_btn.setProperty("class", "success")
+        save_btn.setProperty("variant", "toolbar")
         save_btn.clicked.connect(self.save_table_changes)
         toolbar.addWidget(save_btn)
         
         layout.addLayout(toolbar)
         
         # 表格
-        self.table = QTableWidget()
-        self.table.setFont(QFont("Microsoft YaHei", 10))
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["单词", "含义", "例句", "复习次数", "上次复习"])
-        self.table.horizontalHeader().setFont(QFont("Microsoft YaHei", 10, QFont.Bold))
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.table_model = WordTableModel(self.manager, self)
+        self.table_proxy = QSortFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        self.table = QTableView()
+        self.table.setModel(self.table_proxy)
+        self.table.setFont(ui_font(10))
+        self.table.horizontalHeader().setFont(ui_font(10, bold=True))
+        # 固定列宽，避免ResizeToContents在每次刷新时测量所有行的文本
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        self.table.setColumnWidth(0, 140)
+        self.table.setColumnWidth(3, 80)
+        self.table.setColumnWidth(4, 150)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.table.setAlternatingRowColors(True)
@@ -934,26 +1674,37 @@ class MainWindow(QMainWindow):
         self.table.setWordWrap(True)
         self.table.setEditTriggers(QAbstractItemView.DoubleClicked)  # 双击编辑
         self.table.setSortingEnabled(True)  # 启用排序
-        self.table.itemChanged.connect(self.on_table_item_changed)  # 监听修改
         layout.addWidget(self.table)
         
         # 统计信息
         self.table_stats = QLabel()
-        self.table_stats.setFont(QFont("Microsoft YaHei", 10))
+        self.table_stats.setFont(ui_font(10))
         self.table_stats.setStyleSheet("color: #666; padding: 5px;")
         layout.addWidget(self.table_stats)
         
         return widget
 
+    def _schedule_today_tasks_refresh(self):
+        """单词增删后重算今日任务，短时间内的多次修改只重算一次"""
+        self.manager.invalidate_today_tasks()
+        if not self._today_refresh_pending:
+            self._today_refresh_pending = True
+            QTimer.singleShot(50, self._flush_today_tasks)
+    
+    def _flush_today_tasks(self):
+        self._today_refresh_pending = False
+        self.update_stats()  # update_stats会按需重算今日任务
+    
     def update_stats(self):
-        total = len(self.manager.words)
-        unreviewed = len(self.manager.get_unreviewed_words())
-        mastered = len(self.manager.get_mastered_words())
-        reviewing = total - unreviewed - mastered
+        self.manager.ensure_today_tasks()
+        total = self.manager.total_count
+        unreviewed = self.manager.unreviewed_count
+        mastered = self.manager.mastered_count
+        reviewing = self.manager.reviewing_count
         
         # 今日任务进度
-        today_total = len(self.manager.today_tasks)
-        today_done = len(self.manager.today_completed)
+        today_total = self.manager.today_total
+        today_done = self.manager.today_done
         
         self.stats_label.setText(
             f"总计: {total}  |  未复习: {unreviewed}  |  复习中: {reviewing}  |  已掌握: {mastered}  |  "
@@ -961,8 +1712,8 @@ class MainWindow(QMainWindow):
         )
     
     def next_word(self):
-        words_to_review = self.manager.get_words_to_review()
-        if not words_to_review:
+        next_word = self.manager.peek_next_review_word()
+        if next_word is None:
             self.word_label.setText("今日任务已完成！🎉")
             self.current_word = None
             self.example_text.clear()
@@ -971,7 +1722,10 @@ class MainWindow(QMainWindow):
             self.sound_btn.setVisible(False)  # 隐藏发音按钮
             return
         
-        self.current_word = words_to_review[0]
+        self.current_word = next_word
+        # 当前单词和后面几个单词的发音提前下载，点击播放时直接读本地文件
+        for word in self.manager.upcoming_review_words(1 + AUDIO_PREFETCH_AHEAD):
+            self.prefetch_pronunciation(word)
         
         # 获取复习次数
         review_count = self.manager.words[self.current_word]["review_count"]
@@ -998,12 +1752,27 @@ class MainWindow(QMainWindow):
         if not self.current_word:
             return
         
-        # 使用有道词典语音API
-        # type=1: 美式发音, type=2: 英式发音
-        url = f"https://dict.youdao.com/dictvoice?audio={urllib.parse.quote(self.current_word)}&type=1"
-        self.media_player.setMedia(QMediaContent(QUrl(url)))
+        # 已缓存的直接播放本地文件，否则在线播放（后台同时下载缓存）
+        path = audio_cache_path(self.current_word)
+        if os.path.exists(path):
+            url = QUrl.fromLocalFile(os.path.abspath(path))
+        else:
+            url = QUrl(pronunciation_url(self.current_word))
+            self.prefetch_pronunciation(self.current_word)
+        self.media_player.setMedia(QMediaContent(url))
         self.media_player.play()
     
+    def prefetch_pronunciation(self, word):
+        """在后台下载单词发音，之后点击播放无需再联网"""
+        # 清理已结束的下载线程
+        for w in [w for w, t in self.audio_threads.items() if t.isFinished()]:
+            del self.audio_threads[w]
+        if word in self.audio_threads or os.path.exists(audio_cache_path(word)):
+            return
+        thread = AudioFetchWorker(word)
+        self.audio_threads[word] = thread
+        thread.start()
+    
     def check_answer(self):
         if not self.current_word:
             QMessageBox.information(self, "提示", "请先点击「下一个」获取单词")
@@ -1065,23 +1834,7 @@ class MainWindow(QMainWindow):
         self.next_word()
     
     def fuzzy_match(self, user_input, correct):
-        user_input = user_input.lower().replace(" ", "")
-        correct_lower = correct.lower().replace(" ", "")
-        
-        if user_input in correct_lower or correct_lower in user_input:
-            return True
-        
-        keywords = correct.split('；')[0].split('，')[0].split('、')[0].split(';')[0]
-        keywords = keywords.replace(" ", "").lower()
-        if user_input in keywords or keywords in user_input:
-            return True
-        
-        if len(user_input) >= 2:
-            for i in range(len(correct_lower) - 1):
-                if correct_lower[i:i+2] in user_input:
-                    return True
-        
-        return False
+        return _fuzzy_match(user_input.lower().replace(" ", ""), correct)
     
     def show_answer(self):
         if self.current_word:
@@ -1134,16 +1887,15 @@ class MainWindow(QMainWindow):
                 if not line:
                     continue
                 # 去掉开头的序号（如 "1. "）
-                import re
-                line = re.sub(r'^\d+\.\s*', '', line)
+                line = _EXAMPLE_PREFIX_RE.sub('', line)
                 if line:
                     examples.append({"en": line, "cn": ""})
             
             self.manager.words[self.current_word]["examples"] = examples
         
-        self.manager.save_data()
+        self.manager.save_data_async()
         QMessageBox.information(self, "保存成功", f"已保存 {self.current_word} 的例句修改")
-        self.update_table()
+        self._refresh_table_if_visible()
     
     def import_from_text(self):
         text = self.import_text.toPlainText()
@@ -1161,9 +1913,8 @@ class MainWindow(QMainWindow):
                     msg += f"\n... 还有 {len(added_words) - 10} 个单词"
             QMessageBox.information(self, "导入完成", msg)
             self.import_text.clear()
-            self.manager.init_today_tasks()  # 重新初始化今日任务
-            self.update_stats()
-            self.update_table()
+            self._schedule_today_tasks_refresh()  # 重新初始化今日任务
+            self._refresh_table_if_visible()
     
     def import_words_auto(self):
         text = self.import_text.toPlainText()
@@ -1226,9 +1977,8 @@ class MainWindow(QMainWindow):
                 msg += f"\n... 还有 {len(added_words) - 10} 个单词"
         
         QMessageBox.information(self, "导入完成", msg)
-        self.manager.init_today_tasks()  # 重新初始化今日任务
-        self.update_stats()
-        self.update_table()
+        self._schedule_today_tasks_refresh()  # 重新初始化今日任务
+        self._refresh_table_if_visible()
     
     def _on_fetch_cancel(self):
         if self.fetch_thread:
@@ -1237,11 +1987,23 @@ class MainWindow(QMainWindow):
     def export_to_file(self):
         path, _ = QFileDialog.getSaveFileName(self, "保存文件", "words_export.txt", "文本文件 (*.txt)")
         if path:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(self.manager.export_to_text())
+            with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(self.manager.iter_export_lines())
             QMessageBox.information(self, "导出完成", f"已导出到 {path}")
     
+    def _refresh_table_if_visible(self):
+        """单词数据变化后刷新表格；统计页不可见时只做标记，切换过去时再刷新"""
+        if self.tabs.currentWidget() is self.stats_tab:
+            self.update_table()
+        else:
+            self._stats_dirty = True
+    
+    def _on_tab_changed(self, index):
+        if self.tabs.widget(index) is self.stats_tab and self._stats_dirty:
+            self.update_table()
+    
     def update_table(self):
+        self._stats_dirty = False
         filter_idx = self.filter_combo.currentIndex()
         
         if filter_idx == 0:
@@ -1249,101 +2011,33 @@ class MainWindow(QMainWindow):
         elif filter_idx == 1:
             words = self.manager.get_unreviewed_words()
         elif filter_idx == 2:
-            words = {w: d for w, d in self.manager.words.items() if 0 < d["review_count"] < 3}
+            words = self.manager.get_reviewing_words()
         else:
             words = self.manager.get_mastered_words()
         
-        # 暂时断开信号和排序，避免触发itemChanged
+        # 重置模型和重新排序期间暂停重绘，完成后只绘制一次
+        self.table.setUpdatesEnabled(False)
         try:
-            self.table.itemChanged.disconnect(self.on_table_item_changed)
-        except:
-            pass  # 如果信号未连接，忽略错误
-        
-        self.table.setSortingEnabled(False)  # 填充数据时禁用排序
-        
-        self.table.setRowCount(len(words))
-        for row, (word, data) in enumerate(words.items()):
-            word_item = QTableWidgetItem(word)
-            word_item.setData(Qt.UserRole, word)
-            word_item.setFlags(word_item.flags() & ~Qt.ItemIsEditable)  # 单词列不可编辑
-            self.table.setItem(row, 0, word_item)
-            
-            meaning_item = QTableWidgetItem(data["meaning"])
-            self.table.setItem(row, 1, meaning_item)
-            
-            # 例句列 - 显示完整例句，用换行分隔
-            examples = data.get("examples", [])
-            if examples:
-                example_text = "\n\n".join([ex.get("en", "") for ex in examples])
-                example_item = QTableWidgetItem(example_text)
-            else:
-                example_item = QTableWidgetItem("")
-            self.table.setItem(row, 2, example_item)
-            
-            # 复习次数 - 使用数字类型以便正确排序
-            count_item = QTableWidgetItem()
-            count_item.setData(Qt.DisplayRole, data["review_count"])  # 使用数字
-            count_item.setTextAlignment(Qt.AlignCenter)
-            count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)  # 复习次数不可编辑
-            self.table.setItem(row, 3, count_item)
-            
-            time_item = QTableWidgetItem(data["last_review"] or "-")
-            time_item.setTextAlignment(Qt.AlignCenter)
-            time_item.setFlags(time_item.flags() & ~Qt.ItemIsEditable)  # 时间不可编辑
-            self.table.setItem(row, 4, time_item)
-        
-        self.table.setSortingEnabled(True)  # 填充完成后启用排序
-        
-        # 重新连接信号
-        try:
-            self.table.itemChanged.connect(self.on_table_item_changed)
-        except:
-            pass  # 如果已经连接，忽略错误
+            self.table_model.set_words(words)
+        finally:
+            self.table.setUpdatesEnabled(True)
         
         self.table_stats.setText(f"当前显示 {len(words)} 个单词")
     
-    def on_table_item_changed(self, item):
-        """表格单元格被修改时标记"""
-        # 标记该行已修改（改变背景色）
-        row = item.row()
-        for col in range(self.table.columnCount()):
-            cell_item = self.table.item(row, col)
-            if cell_item:
-                cell_item.setBackground(Qt.yellow)
-    
     def save_table_changes(self):
         """保存表格的修改"""
         modified_count = 0
         
-        # 暂时断开信号
-        try:
-            self.table.itemChanged.disconnect(self.on_table_item_changed)
-        except:
-            pass
-        
-        for row in range(self.table.rowCount()):
-            word_item = self.table.item(row, 0)
-            if not word_item:
-                continue
-            
-            word = word_item.data(Qt.UserRole)
+        for word, changes in self.table_model.take_edits().items():
             if word not in self.manager.words:
                 continue
             
-            # 检查是否有修改（背景色为黄色）
-            if word_item.background().color() != Qt.yellow:
-                continue
+            if 1 in changes:
+                self.manager.words[word]["meaning"] = changes[1]
             
-            # 获取修改后的数据
-            meaning_item = self.table.item(row, 1)
-            example_item = self.table.item(row, 2)
-            
-            if meaning_item:
-                self.manager.words[word]["meaning"] = meaning_item.text()
-            
-            if example_item:
+            if 2 in changes:
                 # 解析例句（每行一个例句）
-                example_text = example_item.text().strip()
+                example_text = changes[2].strip()
                 if example_text:
                     examples = []
                     for line in example_text.split("\n"):
@@ -1354,37 +2048,21 @@ class MainWindow(QMainWindow):
                 else:
                     self.manager.words[word]["examples"] = []
             
-            # 恢复背景色
-            for col in range(self.table.columnCount()):
-                cell_item = self.table.item(row, col)
-                if cell_item:
-                    cell_item.setBackground(Qt.white)
-            
             modified_count += 1
         
         if modified_count > 0:
-            self.manager.save_data()
+            self.manager.save_data_async()
             QMessageBox.information(self, "保存成功", f"已保存 {modified_count} 个单词的修改")
         else:
             QMessageBox.information(self, "提示", "没有需要保存的修改")
-        
-        # 重新连接信号
-        try:
-            self.table.itemChanged.connect(self.on_table_item_changed)
-        except:
-            pass
     
     def delete_selected_words(self):
-        selected_rows = set(item.row() for item in self.table.selectedItems())
+        selected_rows = self.table.selectionModel().selectedRows()  # 每个选中行一个索引
         if not selected_rows:
             QMessageBox.information(self, "提示", "请先选择要删除的单词")
             return
         
-        words_to_delete = []
-        for row in selected_rows:
-            word_item = self.table.item(row, 0)
-            if word_item:
-                words_to_delete.append(word_item.data(Qt.UserRole))
+        words_to_delete = [index.data(Qt.UserRole) for index in selected_rows]
         
         reply = QMessageBox.question(
             self, "确认删除", 
@@ -1395,9 +2073,8 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             count = self.manager.delete_words(words_to_delete)
             QMessageBox.information(self, "删除完成", f"已删除 {count} 个单词")
-            self.manager.init_today_tasks()  # 重新初始化今日任务
-            self.update_stats()
-            self.update_table()
+            self._schedule_today_tasks_refresh()  # 重新初始化今日任务
+            self._refresh_table_if_visible()
     
     def delete_all_words(self):
         if not self.manager.words:
@@ -1411,12 +2088,10 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.manager.words.clear()
-            self.manager.save_data()
-            self.manager.init_today_tasks()  # 重新初始化今日任务
+            self.manager.clear_words()
+            self._schedule_today_tasks_refresh()  # 重新初始化今日任务
             QMessageBox.information(self, "清空完成", "已删除全部单词")
-            self.update_stats()
-            self.update_table()
+            self._refresh_table_if_visible()
 
 
 if __name__ == "__main__":